@@ -1,4 +1,17 @@
-from .exiftoolmgr import ExifToolManager
+from typing import TYPE_CHECKING
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "Francisco José Mata Aroco"
+__all__ = ["ExifToolManager"]
+
+if TYPE_CHECKING:
+    from .exiftoolmgr import ExifToolManager
+
+
+def __getattr__(name: str):
+    """import ExifToolManager (and its kernels) on first access (PEP 562)"""
+    if name == "ExifToolManager":
+        module = importlib.import_module(".exiftoolmgr", __name__)
+        return module.ExifToolManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,13 @@ Python wrapper for 'ExifTool' by 'Phil Harvey' https://exiftool.org/ inspired
 in 'PyExifTool' library by 'Smarnach' https://github.com/smarnach
 ------------------------------------------------------------------------------
 """
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import atexit
 import datetime
-from typing import Tuple, Type
+import os
+from typing import (Callable, Dict, FrozenSet, List, Optional, Tuple, Type,
+                    cast)
 from pathlib import Path
 
 from .kernels.pykernel import PyKernel, Keywords
@@ -36,11 +41,26 @@ class ExifToolManager(kpyexif.PyExifKernel, kpymov.PyMovKernel):
                        'exiftool' name. Alternatively, the file location path
                        can be included in this field
     - logger -> Used for debugging, it generates a logging file if True[bool]
+    - workers -> Number of processes (each one with its own exiftool) used by
+                 get_dates_original_batch(). None uses os.cpu_count() and 1
+                 (default) reads in this process. NOTE: workers > 1 requires
+                 the 'if __name__ == "__main__":' guard in the scripts.
+    - cache_path -> Folder to cache the metadata read in disk (see PyKernel)
     --------------------------------------------------------------------------
     Main Methods:
     - metadata -> Dictionary with all metadata
     - load_file() -> load file to read/write/edit
     - save_file() -> Save the changes added with 'set_***' functions
+    - get_dates_original_batch() -> Read the date original of several files
+    - set_dates_original_batch() -> Write the date original of several files
+    - queue_set_date_original() -> Queue a date original to write in commit()
+    - commit() -> Write all the dates queued
+    --------------------------------------------------------------------------
+    Context Manager:
+        with ExifToolManager() as mgr:
+            mgr.queue_set_date_original(file1, date1)
+            mgr.queue_set_date_original(file2, date2)
+            mgr.commit()
     --------------------------------------------------------------------------
     Basic Methods:
     - is_*** -> Boolean properties of the file extension itself
@@ -54,57 +74,53 @@ class ExifToolManager(kpyexif.PyExifKernel, kpymov.PyMovKernel):
     --------------------------------------------------------------------------
     """
     # pylint: disable=protected-access
+    # BaseClases, Keywords and original date handlers (see CLASS CONSTANTS)
+    _bases: Tuple[Type[PyKernel], ...] = ()
+    _keywords: Tuple[Type[BaseKwd], ...] = ()
+    _set_handlers: Dict[str, Callable[..., None]] = {}
+    _read_fields: Dict[str, Tuple[str, ...]] = {}
+    _write_fields: Dict[str, str] = {}
+
     def __init__(self, exiftool_path=Path("exiftool"), logger=True,
-                 log_path=Path.cwd()) -> None:
+                 log_path: Optional[Path] = None,
+                 workers: Optional[int] = 1,
+                 cache_path: Optional[Path] = None) -> None:
         super().__init__(exiftool_path=exiftool_path, logger=logger,
-                         log_path=log_path)
-
-        # Get the Readable and Dditable formats based on PyExifManager.Parents
-        self._readable_formats = self.fast_readable_formats()
-        self._editable_formats = self.fast_editable_formats()
-
-        # Get the BaseClases and Keywords
-        self._bases: Tuple[Type[PyKernel], ...] = ()
-        self._keywords: Tuple[Type[BaseKwd], ...] = ()
-        for child in ExifToolManager.__bases__:
-            child_kwd = getattr(child, "_" + child.__name__ + "__KEYWORD")
-            self._keywords += (child_kwd, )
-            self._bases += (child, )
+                         log_path=log_path, cache_path=cache_path)
+        self._workers: int = workers or os.cpu_count() or 1
+        self._worker_pool: Optional[_ExifWorkerPool] = None
+        self._pending: List[Tuple[Path, str]] = []
 
     @property
     def readable_extensions(self) -> Tuple[str, ...]:
         """get all the readable formats"""
-        return self._readable_formats
+        return _READABLE_FORMATS
 
     @property
     def editable_extensions(self) -> Tuple[str, ...]:
         """get all the editable formats"""
-        return self._editable_formats
+        return _EDITABLE_FORMATS
 
     @property
     def has_readable_metadate(self) -> bool:
         """return if the metadata creation date is readable"""
         assert self._filepath is not None, "file not loaded"
-        return self._filepath.suffix[1:].upper() in self._readable_formats
+        return self._ext in _READABLE_SET
 
     @property
     def has_editable_metadate(self) -> bool:
         """return if the metadata creation date is editable"""
         assert self._filepath is not None, "file not loaded"
-        return self._filepath.suffix[1:].upper() in self._editable_formats
+        return self._ext in _EDITABLE_SET
 
     @property
     def has_metadata_date_original_field(self) -> bool:
         """
         Get if the field containing the original date exist
         """
-        if not self.has_readable_metadate:
-            return False
-        if self.has_exif_date_original_field:
-            return True
-        if self.has_mov_create_date_field:
-            return True
-        return False
+        assert self._filepath is not None, "file not loaded"
+        return any(kwrd in self._metadata
+                   for kwrd in self._read_fields.get(self._ext, ()))
 
     @property
     def has_metadata_date_original(self) -> bool:
@@ -112,55 +128,39 @@ class ExifToolManager(kpyexif.PyExifKernel, kpymov.PyMovKernel):
         Function to scan if the file has createdate
         > Include more cases if added to 'kernels'
         """
-        if not self.has_readable_metadate:
-            return False
-        if self.has_exif_original_date:
-            return True
-        if self.has_mov_create_date:
-            return True
-        return False
+        assert self._filepath is not None, "file not loaded"
+        return any(self._has_metadate(kwrd)
+                   for kwrd in self._read_fields.get(self._ext, ()))
 
     @staticmethod
     def fast_readable_formats() -> Tuple[str, ...]:
         """Get the Readable formats based on PyExifManager.Parents"""
-        readable_formats: Tuple[str, ...] = ()
-        for chld in ExifToolManager.__bases__:
-            kwrd: BaseKwd = getattr(chld, "_" + chld.__name__ + "__KEYWORD")
-            if kwrd.readable:
-                readable_formats += kwrd.extensions
-        return readable_formats
+        return _READABLE_FORMATS
 
     @staticmethod
     def fast_editable_formats() -> Tuple[str, ...]:
         """Get the Editable formats based on PyExifManager.Parents"""
-        editable_formats: Tuple[str, ...] = ()
-        for chld in ExifToolManager.__bases__:
-            kwrd: BaseKwd = getattr(chld, "_" + chld.__name__ + "__KEYWORD")
-            if kwrd.editable:
-                editable_formats += kwrd.extensions
-        return editable_formats
+        return _EDITABLE_FORMATS
 
     @staticmethod
     def fast_has_readable_metadate(filename: Path) -> bool:
         """return if the metadata creation date is readable"""
-        extn = filename.suffix[1:].upper()
-        return extn in ExifToolManager.fast_readable_formats()
+        return filename.suffix[1:].upper() in _READABLE_SET
 
     @staticmethod
     def fast_has_editable_metadate(filename: Path) -> bool:
         """return if the metadata creation date is editable"""
-        extn = filename.suffix[1:].upper()
-        return extn in ExifToolManager.fast_editable_formats()
+        return filename.suffix[1:].upper() in _EDITABLE_SET
 
     def get_date_original(self) -> datetime.datetime:
         """
         Function to return the file has createdate
         > Include more cases if added to 'kernels'
         """
-        if self.has_exif_original_date:
-            return self.get_exif_original_date()
-        if self.has_mov_create_date:
-            return self.get_mov_create_date()
+        assert self._filepath is not None, "file not loaded"
+        for kwrd in self._read_fields.get(self._ext, ()):
+            if self._has_metadate(kwrd):
+                return self._get_metadate(kwrd)
 
         err_msg = "No metadata! call 'self.has_metadata_create_date' "
         err_msg += "for avoiding this error"
@@ -171,46 +171,293 @@ class ExifToolManager(kpyexif.PyExifKernel, kpymov.PyMovKernel):
         Function to return the file has createdate
         > Include more cases if added to 'kernels'
         """
-        if self.has_exif_date_original_field:
-            return self.get_exif_date_original_as_str()
-        if self.has_mov_create_date_field:
-            return self.get_mov_create_date_as_str()
+        assert self._filepath is not None, "file not loaded"
+        for kwrd in self._read_fields.get(self._ext, ()):
+            if kwrd in self._metadata:
+                return self._metadata[kwrd]
         return ""
 
     def set_date_original(self, date2add: datetime.datetime):
         """set the metadata creation date"""
         assert self._filepath is not None, "file not loaded"
-        extension = self._filepath.suffix[1:].upper()
-
-        if extension in Keywords.Exif.extensions:
-            self.set_exif_original_date(date2add)
 
-        elif extension in Keywords.QuickTime.extensions:
-            self.set_mov_create_date(date2add)
+        if self._ext in self._set_handlers:
+            self._set_handlers[self._ext](self, date2add)
 
         else:
             err_msg = "No compatible file to set metadata createdate! call "
             err_msg += "'self.has_editable_metadate' for avoiding this error"
             assert False, err_msg
 
+    def get_dates_original_batch(self, files2read: List[Path], timeout=30
+                                 ) -> Dict[Path, datetime.datetime]:
+        """
+        ----------------------------------------------------------------------
+        Read the metadata original date of several files with one exiftool
+        execution per <batch_max_files> files (same criteria as
+        get_date_original). The timeout is applied to each execution.
+        > Returns {file: date} (files without a valid date are not included)
+        ----------------------------------------------------------------------
+        NOTE: The file loaded with load_file() (if any) is not modified.
+        ----------------------------------------------------------------------
+        """
+        if not files2read:
+            return {}
+        if self._workers > 1:
+            if self._worker_pool is None:
+                self._worker_pool = _ExifWorkerPool(self._exiftool_path,
+                                                    self._workers)
+            return self._worker_pool.get_dates_original(files2read, timeout)
+
+        arguments: list = ['-G', '-J'] + [
+            '-' + kwrd for kwrd in sorted(set(_DATE_FIELDS.values()))]
+        files2read = list(files2read)
+        dates: Dict[Path, datetime.datetime] = {}
+        for idx in range(0, len(files2read), self.batch_max_files):
+            chunk = files2read[idx:idx + self.batch_max_files]
+            raw_mdta = self._execute(arguments + chunk, timeout)
+            if not raw_mdta.strip():
+                continue
+            for metadata in self._json_loads(raw_mdta):
+                date = self._metadata_date_original(metadata)
+                if date is not None:
+                    dates[Path(metadata["SourceFile"])] = date
+        return dates
+
+    def set_dates_original_batch(
+            self, dates2add: Dict[Path, datetime.datetime], timeout=30
+    ) -> Dict[Path, bool]:
+        """
+        ----------------------------------------------------------------------
+        Write the metadata original date of several files (overwriting them)
+        with one '-execute' block per file in the same exiftool process.
+        > Returns {file: success}
+        ----------------------------------------------------------------------
+        NOTE: The file loaded with load_file() (if any) is not modified.
+        ----------------------------------------------------------------------
+        """
+        success: Dict[Path, bool] = {}
+        commands: List[Tuple[Path, str]] = []
+        for file2edit, date2add in dates2add.items():
+            kwrd = self._write_fields.get(file2edit.suffix[1:].upper())
+            if kwrd is None:
+                if self._log_enabled:
+                    self.log.warning("No editable metadate for %s", file2edit)
+                success[file2edit] = False
+            else:
+                commands.append((file2edit,
+                                 self._setmetadates(kwrd, date2add)))
+        success.update(self._write_commands(commands, timeout))
+        return {file2edit: success[file2edit] for file2edit in dates2add}
+
+    def queue_set_date_original(self, file2edit: Path,
+                                date2add: datetime.datetime) -> None:
+        """queue the metadata creation date of a file (see commit())"""
+        kwrd = self._write_fields.get(file2edit.suffix[1:].upper())
+        if kwrd is None:
+            err_msg = "No compatible file to set metadata createdate! call "
+            err_msg += "'self.fast_has_editable_metadate' for avoiding this "
+            err_msg += "error"
+            assert False, err_msg
+        self._pending.append((file2edit, self._setmetadates(kwrd, date2add)))
+
+    def commit(self, timeout=30) -> Dict[Path, bool]:
+        """
+        ----------------------------------------------------------------------
+        Write (overwriting the files) all the dates queued with
+        queue_set_date_original() in the same exiftool process.
+        Each file is dequeued once written, so if the execution fails the
+        files not written yet stay queued for the next commit().
+        > Returns {file: success}
+        ----------------------------------------------------------------------
+        """
+        success: Dict[Path, bool] = {}
+        while self._pending:
+            success.update(self._write_commands(self._pending[:1], timeout))
+            del self._pending[0]
+        return success
+
+    def _write_commands(self, commands: List[Tuple[Path, str]], timeout=30
+                        ) -> Dict[Path, bool]:
+        """execute one '-execute' block per (file, command) overwriting it"""
+        success: Dict[Path, bool] = {}
+        for file2edit, command in commands:
+            arguments = ["-P", "-overwrite_original", command, file2edit]
+            self._uncache(file2edit)
+            result = self._execute(arguments, timeout).decode()
+            success[file2edit] = ('unchanged' not in result
+                                  ) and ('errors' not in result)
+            if self._log_enabled:
+                self.log.info("[ExiftoolMgr] Writing file: %s -> %s",
+                              file2edit, result.strip())
+        return success
+
+    def close(self) -> None:
+        """terminate the exiftool stay_open process and the worker pool"""
+        # getattr: __del__ also runs when __init__ raised before the pool
+        worker_pool = getattr(self, "_worker_pool", None)
+        self._worker_pool = None
+        if worker_pool is not None:
+            worker_pool.shutdown()
+        super().close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    @classmethod
+    def _metadata_date_original(cls, metadata: dict
+                                ) -> Optional[datetime.datetime]:
+        """
+        get the original date of the metadata given (None if not found) from
+        the date fields of its extension in order (same criteria as
+        get_date_original)
+        """
+        ext = Path(metadata["SourceFile"]).suffix[1:].upper()
+        for kwrd in cls._read_fields.get(ext, ()):
+            try:
+                return cls._metadates(metadata[kwrd].split())
+            except (IndexError, KeyError, ValueError):
+                continue
+        return None
+
+
+def _chunk_list(items: List[Path], chunks: int) -> List[List[Path]]:
+    """split the items in (up to) the given number of contiguous chunks"""
+    size, extra = divmod(len(items), chunks)
+    output: List[List[Path]] = []
+    start = 0
+    for idx in range(chunks):
+        end = start + size + (idx < extra)
+        if end > start:
+            output.append(items[start:end])
+        start = end
+    return output
+
+
+# Manager of the <_ExifWorkerPool> process (one per process)
+_WORKER_MGR: Optional[ExifToolManager] = None
+
+
+def _init_worker(exiftool_path: Path) -> None:
+    """initializer of the <_ExifWorkerPool> processes"""
+    global _WORKER_MGR  # pylint: disable=global-statement
+    _WORKER_MGR = ExifToolManager(exiftool_path, logger=False)
+    atexit.register(_WORKER_MGR.close)
+
+
+def _worker_dates_original(files2read: List[Path], timeout=30
+                           ) -> Dict[Path, datetime.datetime]:
+    """task of the <_ExifWorkerPool> processes"""
+    assert _WORKER_MGR is not None, "worker not initialized"
+    return _WORKER_MGR.get_dates_original_batch(files2read, timeout)
+
+
+class _ExifWorkerPool:
+    """
+    --------------------------------------------------------------------------
+    Pool of processes, each one keeping its own ExifToolManager (and hence
+    its own exiftool stay_open process) alive between tasks.
+    --------------------------------------------------------------------------
+    The processes are spawned (not forked) in every platform: the forked
+    ones end with os._exit() skipping the atexit handlers that close their
+    exiftool processes, and they would inherit the pipes of the parent.
+    --------------------------------------------------------------------------
+    """
+    def __init__(self, exiftool_path=Path("exiftool"),
+                 max_workers: Optional[int] = None) -> None:
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker, initargs=(exiftool_path, ))
+
+    def get_dates_original(self, files2read: List[Path], timeout=30
+                           ) -> Dict[Path, datetime.datetime]:
+        """split the files between the workers and merge their results"""
+        futures = [self._executor.submit(_worker_dates_original, chunk,
+                                         timeout)
+                   for chunk in _chunk_list(list(files2read),
+                                            self._max_workers)]
+        dates: Dict[Path, datetime.datetime] = {}
+        for future in futures:
+            dates.update(future.result())
+        return dates
+
+    def shutdown(self) -> None:
+        """terminate the processes of the pool"""
+        self._executor.shutdown()
+
 
 # ----------------------------------------------------------------------------
 #                                 AUTOTEST
 # ----------------------------------------------------------------------------
-# Verify that every <ExifToolMgr.Childs> has a valid constant <__KEYWORD>
+# Verify that every <ExifToolMgr.Childs> has a valid constant <KEYWORD>
+# ----------------------------------------------------------------------------
+_CHILDS = cast(Tuple[Type[PyKernel], ...], ExifToolManager.__bases__)
+if __debug__:
+    _ERRSZE = 109
+    _ERRLIN0 = "\n" + "-" * _ERRSZE + "\nERROR: "
+    _ERRLON1 = "\n" + "-" * _ERRSZE
+    for _child in _CHILDS:
+        try:
+            _kwd = _child.KEYWORD
+            _ERRMSG = _ERRLIN0
+            _ERRMSG += f"{_child}.KEYWORD is not a <BaseKwd> subclass"
+            _ERRMSG += _ERRLON1
+            assert issubclass(_kwd, BaseKwd), _ERRMSG
+        except AttributeError:
+            _ERRMSG = _ERRLIN0
+            _ERRMSG += f"{_child} has not the mandatory attribute <KEYWORD>."
+            _ERRMSG += _ERRLON1
+            assert False, _ERRMSG
+
+
 # ----------------------------------------------------------------------------
-_ERRSZE = 109
-_ERRLIN0 = "\n" + "-" * _ERRSZE + "\nERROR: "
-_ERRLON1 = "\n" + "-" * _ERRSZE
-for _child in ExifToolManager.__bases__:
-    try:
-        _kwd = getattr(_child, "_" + _child.__name__ + "__KEYWORD")
-        _ERRMSG = _ERRLIN0
-        _ERRMSG += f"{_child}.__KEYWORD is not a <BaseKwd> subclass"
-        _ERRMSG += _ERRLON1
-        assert issubclass(_kwd, BaseKwd), _ERRMSG
-    except AttributeError:
-        _ERRMSG = _ERRLIN0
-        _ERRMSG += f"{_child} has not the mandatory attribute <__KEYWORD>."
-        _ERRMSG += _ERRLON1
-        assert False, _ERRMSG
+#                              CLASS CONSTANTS
+# ----------------------------------------------------------------------------
+# Computed only once from the <ExifToolManager.Childs> KEYWORD constants:
+# - Readable & Editable formats (tuples and frozensets)
+# - ExifToolManager._bases & ExifToolManager._keywords
+# - ExifToolManager._set_handlers: {extension: original date setter}
+# - ExifToolManager._read_fields: {extension: original date fields} read in
+#   order (the field of its Keyword first, then the ones of the others)
+# - ExifToolManager._write_fields: {extension: original date field}
+# ----------------------------------------------------------------------------
+_DATE_FIELDS: Dict[Type[BaseKwd], str] = {
+    Keywords.Exif: Keywords.Exif.datetime_original,
+    Keywords.QuickTime: Keywords.QuickTime.create_date}
+_DATE_SETTERS: Dict[Type[BaseKwd], Callable[..., None]] = {
+    Keywords.Exif: kpyexif.PyExifKernel.set_exif_original_date,
+    Keywords.QuickTime: kpymov.PyMovKernel.set_mov_create_date}
+
+
+def _class_constants(childs: Tuple[Type[PyKernel], ...]) -> tuple:
+    """get the class constants (see above) of the childs given"""
+    keywords = tuple(child.KEYWORD for child in childs)
+    readable = [kwd for kwd in keywords if kwd.readable]
+    editable = [kwd for kwd in keywords if kwd.editable]
+    set_handlers: Dict[str, Callable[..., None]] = {}
+    read_fields: Dict[str, Tuple[str, ...]] = {}
+    write_fields: Dict[str, str] = {}
+    for kwd in readable:
+        fields = (_DATE_FIELDS[kwd], ) + tuple(
+            _DATE_FIELDS[other] for other in readable if other is not kwd)
+        read_fields.update(dict.fromkeys(kwd.extensions, fields))
+    for kwd in editable:
+        set_handlers.update(dict.fromkeys(kwd.extensions, _DATE_SETTERS[kwd]))
+        write_fields.update(dict.fromkeys(kwd.extensions, _DATE_FIELDS[kwd]))
+    readable_formats = sum((kwd.extensions_tuple for kwd in readable), ())
+    editable_formats = sum((kwd.extensions_tuple for kwd in editable), ())
+    return (readable_formats, editable_formats, childs, keywords,
+            set_handlers, read_fields, write_fields)
+
+
+# pylint: disable=protected-access
+(_READABLE_FORMATS, _EDITABLE_FORMATS,
+ ExifToolManager._bases, ExifToolManager._keywords,
+ ExifToolManager._set_handlers, ExifToolManager._read_fields,
+ ExifToolManager._write_fields
+ ) = _class_constants(_CHILDS)
+# pylint: enable=protected-access
+_READABLE_SET: FrozenSet[str] = frozenset(_READABLE_FORMATS)
+_EDITABLE_SET: FrozenSet[str] = frozenset(_EDITABLE_FORMATS)
@@ -1,4 +1,23 @@
 """kernels"""
+from typing import TYPE_CHECKING
+import importlib
+
 from .pygroups import BaseKwd
-from .kpyexif import PyExifKernel
-from .kpymov import PyMovKernel
+
+if TYPE_CHECKING:
+    from .kpyexif import PyExifKernel
+    from .kpymov import PyMovKernel
+    from .pykernel_pool import PyKernelPool
+
+# Kernels imported on first access (PEP 562): {name: module}
+_KERNEL_REGISTRY = {"PyExifKernel": ".kpyexif",
+                    "PyMovKernel": ".kpymov",
+                    "PyKernelPool": ".pykernel_pool"}
+
+
+def __getattr__(name: str):
+    """import the kernel requested only when it is accessed"""
+    if name in _KERNEL_REGISTRY:
+        module = importlib.import_module(_KERNEL_REGISTRY[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,9 @@
 """kpyexif"""
 import datetime
+from typing import ClassVar, Optional, Type
 from pathlib import Path
 from .pykernel import PyKernel
-from .pygroups import Keywords
+from .pygroups import BaseKwd, Keywords
 
 
 class PyExifKernel(PyKernel):
@@ -12,12 +13,15 @@ class PyExifKernel(PyKernel):
     detection only.
     --------------------------------------------------------------------------
     """
+    KEYWORD: ClassVar[Type[BaseKwd]] = Keywords.Exif
+    # Private alias (MRO-safe in multiple inheritance)
     __KEYWORD = Keywords.Exif
 
     def __init__(self, exiftool_path=Path("exiftool"), logger=True,
-                 log_path=Path.cwd()) -> None:
+                 log_path: Optional[Path] = None,
+                 cache_path: Optional[Path] = None) -> None:
         super().__init__(exiftool_path=exiftool_path, logger=logger,
-                         log_path=log_path)
+                         log_path=log_path, cache_path=cache_path)
 
     @property
     def has_exif_date_original_field(self) -> bool:
@@ -27,48 +31,18 @@ class PyExifKernel(PyKernel):
     @property
     def has_exif_modify_date(self) -> bool:
         """Check if the EXIF:ModifyDate exists (DateTime)"""
-        if self.__KEYWORD.modify_date in self._metadata:
-            try:
-                self.get_exif_modify_date()
-                return True
-            except IndexError:
-                return False
-            except KeyError:
-                return False
-            except ValueError:
-                return False
-        return False
+        return self._has_metadate(self.__KEYWORD.modify_date)
 
     @property
     def has_exif_original_date(self) -> bool:
         """Check if the EXIF:DateTimeOriginal exists (Original)"""
-        if self.__KEYWORD.datetime_original in self._metadata:
-            try:
-                self.get_exif_original_date()
-                return True
-            except IndexError:
-                return False
-            except KeyError:
-                return False
-            except ValueError:
-                return False
-        return False
+        return self._has_metadate(self.__KEYWORD.datetime_original)
 
     @property
     def has_exif_digitized_date(self) -> bool:
         """Check if the EXIF:CreateDate exists (Digitized)"""
         # pylint: disable=protected-access
-        if self.__KEYWORD._date_digitized in self._metadata:
-            try:
-                self.get_exif_digitized_date()
-                return True
-            except IndexError:
-                return False
-            except KeyError:
-                return False
-            except ValueError:
-                return False
-        return False
+        return self._has_metadate(self.__KEYWORD._date_digitized)
 
     def get_exif_camera_make(self) -> str:
         """get the EXIF:Make (camera make)"""
@@ -84,19 +58,16 @@ class PyExifKernel(PyKernel):
 
     def get_exif_modify_date(self) -> datetime.datetime:
         """get the EXIF:ModifyDate in datetime format (DateTime)"""
-        values = self._metadata[self.__KEYWORD.modify_date].split()
-        return self._metadates(values)
+        return self._get_metadate(self.__KEYWORD.modify_date)
 
     def get_exif_original_date(self) -> datetime.datetime:
         """get the EXIF:DateTimeOriginal in datetime format"""
-        values = self._metadata[self.__KEYWORD.datetime_original].split()
-        return self._metadates(values)
+        return self._get_metadate(self.__KEYWORD.datetime_original)
 
     def get_exif_digitized_date(self) -> datetime.datetime:
         """get the EXIF:CreateDate in datetime format (Digitized)"""
         # pylint: disable=protected-access
-        values = self._metadata[self.__KEYWORD._date_digitized].split()
-        return self._metadates(values)
+        return self._get_metadate(self.__KEYWORD._date_digitized)
 
     def get_exif_date_original_as_str(self) -> str:
         """get the EXIF:DateTimeOriginal in string format"""
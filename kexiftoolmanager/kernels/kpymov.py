@@ -1,8 +1,9 @@
 """kpymov"""
 import datetime
+from typing import ClassVar, Optional, Type
 from pathlib import Path
 from .pykernel import PyKernel
-from .pygroups import Keywords
+from .pygroups import BaseKwd, Keywords
 
 
 class PyMovKernel(PyKernel):
@@ -11,12 +12,15 @@ class PyMovKernel(PyKernel):
     Class for Mov
     --------------------------------------------------------------------------
     """
+    KEYWORD: ClassVar[Type[BaseKwd]] = Keywords.QuickTime
+    # Private alias (MRO-safe in multiple inheritance)
     __KEYWORD = Keywords.QuickTime
 
     def __init__(self, exiftool_path=Path("exiftool"), logger=True,
-                 log_path=Path.cwd()) -> None:
+                 log_path: Optional[Path] = None,
+                 cache_path: Optional[Path] = None) -> None:
         super().__init__(exiftool_path=exiftool_path, logger=logger,
-                         log_path=log_path)
+                         log_path=log_path, cache_path=cache_path)
 
     @property
     def has_mov_create_date_field(self) -> bool:
@@ -26,22 +30,11 @@ class PyMovKernel(PyKernel):
     @property
     def has_mov_create_date(self) -> bool:
         """Check if the QuickTime:CreateDate exists"""
-        if self.__KEYWORD.create_date in self._metadata:
-            try:
-                self.get_mov_create_date()
-                return True
-            except IndexError:
-                return False
-            except KeyError:
-                return False
-            except ValueError:
-                return False
-        return False
+        return self._has_metadate(self.__KEYWORD.create_date)
 
     def get_mov_create_date(self) -> datetime.datetime:
         """get the QuickTime:CreateDate in datetime format"""
-        values = self._metadata[self.__KEYWORD.create_date].split()
-        return self._metadates(values)
+        return self._get_metadate(self.__KEYWORD.create_date)
 
     def get_mov_create_date_as_str(self) -> str:
         """get the QuickTime:CreateDate in datetime format"""
@@ -1,41 +1,28 @@
 """Groups y keywords for file metadata access"""
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple
+from typing import ClassVar, FrozenSet, List, Tuple
 
 
-class BaseKwd(ABC):
-    """BaseClassForAllKeywords"""
-    @property
-    @abstractmethod
-    def readable(self) -> bool:
-        """
-        ----------------------------------------------------------------------
-        return if the metadata is readable by exiftool (https://exiftool.org/)
-        ----------------------------------------------------------------------
-        """
-
-    @property
-    @abstractmethod
-    def editable(self) -> bool:
-        """
-        ----------------------------------------------------------------------
-        return if the metadata is editable by exiftool (https://exiftool.org/)
-        ----------------------------------------------------------------------
-        """
-
-    @property
-    @abstractmethod
-    def extensions(self) -> Tuple[str, ...]:
-        """
-        ----------------------------------------------------------------------
-        Return the Keyword list of compatible formats (Uppercase without '.')
+class BaseKwd:
+    """
+    --------------------------------------------------------------------------
+    BaseClassForAllKeywords
+    --------------------------------------------------------------------------
+    - readable -> if the metadata is readable by exiftool (exiftool.org)
+    - editable -> if the metadata is editable by exiftool (exiftool.org)
+    - extensions -> Keyword set of compatible formats (Uppercase without '.')
+    - extensions_tuple -> Same as 'extensions' but keeping the order
         - Keyword: exiftool uses keywords (also called groups) to arrange the
                    metadata information. For each field desired to use, a new
                    Keyword must be created indicating a list with the
                    compatible extensions.
-        ----------------------------------------------------------------------
-        """
+    --------------------------------------------------------------------------
+    """
+    __slots__ = ()
+    readable: ClassVar[bool]
+    editable: ClassVar[bool]
+    extensions: ClassVar[FrozenSet[str]] = frozenset()
+    extensions_tuple: ClassVar[Tuple[str, ...]] = ()
 
 
 @dataclass
@@ -56,67 +43,83 @@ class Keywords:
     https://exiftool.org/TagNames/
     --------------------------------------------------------------------------
     """
-    @dataclass
+    @dataclass(frozen=True)
     class ExifTool(BaseKwd):
         """ExifTool Group"""
-        readable = True
-        editable = False
-        extensions = ()
-        tool_version = "ExifTool:ExifToolVersion"
+        __slots__ = ()
+        readable: ClassVar[bool] = True
+        editable: ClassVar[bool] = False
+        extensions_tuple: ClassVar[Tuple[str, ...]] = ()
+        extensions: ClassVar[FrozenSet[str]] = frozenset()
+        tool_version: ClassVar[str] = "ExifTool:ExifToolVersion"
 
-    @dataclass
+    @dataclass(frozen=True)
     class File(BaseKwd):
         """File Group"""
-        readable = True
-        editable = False
-        extensions = ()
-        modify_date = "File:FileModifyDate"
-        access_date = "File:FileAccessDate"
-        create_date = "File:FileCreateDate"
+        __slots__ = ()
+        readable: ClassVar[bool] = True
+        editable: ClassVar[bool] = False
+        extensions_tuple: ClassVar[Tuple[str, ...]] = ()
+        extensions: ClassVar[FrozenSet[str]] = frozenset()
+        modify_date: ClassVar[str] = "File:FileModifyDate"
+        access_date: ClassVar[str] = "File:FileAccessDate"
+        create_date: ClassVar[str] = "File:FileCreateDate"
 
-    @dataclass
+    @dataclass(frozen=True)
     class Exif(BaseKwd):
         """Exif Group"""
-        readable = True
-        editable = True
-        extensions = "JPEG", "JPG", "PNG", "MPO"
-        camera_model = "EXIF:Model"
-        camera_make = "EXIF:Make"
-        modify_date = "EXIF:ModifyDate"
-        _date_digitized = "EXIF:CreateDate"  # Not stable, use DatTimeOriginal
-        datetime_original = "EXIF:DateTimeOriginal"
+        __slots__ = ()
+        readable: ClassVar[bool] = True
+        editable: ClassVar[bool] = True
+        extensions_tuple: ClassVar[Tuple[str, ...]] = (
+            "JPEG", "JPG", "PNG", "MPO")
+        extensions: ClassVar[FrozenSet[str]] = frozenset(extensions_tuple)
+        camera_model: ClassVar[str] = "EXIF:Model"
+        camera_make: ClassVar[str] = "EXIF:Make"
+        modify_date: ClassVar[str] = "EXIF:ModifyDate"
+        # Not stable, use DatTimeOriginal
+        _date_digitized: ClassVar[str] = "EXIF:CreateDate"
+        datetime_original: ClassVar[str] = "EXIF:DateTimeOriginal"
 
-    @dataclass
+    @dataclass(frozen=True)
     class QuickTime(BaseKwd):
         """QuickTime and Mov Group"""
-        readable = True
-        editable = True
-        extensions = "MOV", "3GP", "MP4", "M4V"
-        create_date = "QuickTime:CreateDate"
-        modify_date = "QuickTime:ModifyDate"
-        track_create_date = "QuickTime:TrackCreateDate"
-        track_modify_date = "QuickTime:TrackModifyDate"
-        media_create_date = "QuickTime:MediaCreateDate"
-        media_modify_date = "QuickTime:MediaModifyDate"
-        comment = "QuickTime:Comment"
+        __slots__ = ()
+        readable: ClassVar[bool] = True
+        editable: ClassVar[bool] = True
+        extensions_tuple: ClassVar[Tuple[str, ...]] = (
+            "MOV", "3GP", "MP4", "M4V")
+        extensions: ClassVar[FrozenSet[str]] = frozenset(extensions_tuple)
+        create_date: ClassVar[str] = "QuickTime:CreateDate"
+        modify_date: ClassVar[str] = "QuickTime:ModifyDate"
+        track_create_date: ClassVar[str] = "QuickTime:TrackCreateDate"
+        track_modify_date: ClassVar[str] = "QuickTime:TrackModifyDate"
+        media_create_date: ClassVar[str] = "QuickTime:MediaCreateDate"
+        media_modify_date: ClassVar[str] = "QuickTime:MediaModifyDate"
+        comment: ClassVar[str] = "QuickTime:Comment"
 
-    @dataclass
+    @dataclass(frozen=True)
     class Asf(BaseKwd):
         """Asf Group"""
-        readable = False
-        editable = False
-        extensions = ()
-        create_date = "ASF:CreationDate"
+        __slots__ = ()
+        readable: ClassVar[bool] = False
+        editable: ClassVar[bool] = False
+        extensions_tuple: ClassVar[Tuple[str, ...]] = ()
+        extensions: ClassVar[FrozenSet[str]] = frozenset()
+        create_date: ClassVar[str] = "ASF:CreationDate"
 
-    @dataclass
+    @dataclass(frozen=True)
     class NoArranged(BaseKwd):
         """no metadata date info"""
-        readable = False
-        editable = False
-        extensions = "BMP", "AVI", "MPG", "WAV", "MP3"
-        ext_image = ("BMP", )
-        ext_audio = ("WAV", "MP3")
-        ext_video = ("AVI", "MPG")
+        __slots__ = ()
+        readable: ClassVar[bool] = False
+        editable: ClassVar[bool] = False
+        extensions_tuple: ClassVar[Tuple[str, ...]] = (
+            "BMP", "AVI", "MPG", "WAV", "MP3")
+        extensions: ClassVar[FrozenSet[str]] = frozenset(extensions_tuple)
+        ext_image: ClassVar[Tuple[str, ...]] = ("BMP", )
+        ext_audio: ClassVar[Tuple[str, ...]] = ("WAV", "MP3")
+        ext_video: ClassVar[Tuple[str, ...]] = ("AVI", "MPG")
 
 
 # ----------------------------------------------------------------------------
@@ -128,26 +131,26 @@ class Keywords:
 #   extensions=() except for <ExifTool> and <File> Keywords since those are
 #   not real metadata information of the file
 # ----------------------------------------------------------------------------
-_ERRSZE = 109
-_ERRLIN0 = "\n" + "-" * _ERRSZE + "\nERROR: "
-_ERRLON1 = "\n" + "-" * _ERRSZE
-for _name in [x for x in vars(Keywords) if "__" not in x]:
-    _ERRMSG = _ERRLIN0
-    _ERRMSG += f"Keywords.{_name} is not a Class.Child of <BaseKwd>"
-    _ERRMSG += _ERRLON1
-    _INSTANCE = getattr(Keywords, _name)()
-    assert isinstance(_INSTANCE, BaseKwd), _ERRMSG
+if __debug__:
+    _ERRSZE = 109
+    _ERRLIN0 = "\n" + "-" * _ERRSZE + "\nERROR: "
+    _ERRLON1 = "\n" + "-" * _ERRSZE
+    _ERRORS: List[str] = []
+    for _name in [x for x in vars(Keywords) if "__" not in x]:
+        _INSTANCE = getattr(Keywords, _name)()
+        if not isinstance(_INSTANCE, BaseKwd):
+            _ERRORS.append(f"Keywords.{_name} is not a Class.Child of "
+                           "<BaseKwd>")
+            continue
 
-    _ERRMSG = _ERRLIN0
-    _ERRMSG += f"Keywords.{_name} can not be <editable> and NOT <readable> "
-    _ERRMSG += "at the same time"
-    _ERRMSG += _ERRLON1
-    assert not (_INSTANCE.editable and not _INSTANCE.readable), _ERRMSG
+        if _INSTANCE.editable and not _INSTANCE.readable:
+            _ERRORS.append(f"Keywords.{_name} can not be <editable> and NOT "
+                           "<readable> at the same time")
 
-    _ERRMSG = _ERRLIN0
-    _ERRMSG += f"Keywords.{_name} can not be <editable or readable> "
-    _ERRMSG += "without indicating its compatible <extensions=()>"
-    _ERRMSG += _ERRLON1
-    _BOOLER = _INSTANCE.editable or _INSTANCE.readable
-    _BOOLCL = _BOOLER and _name not in ('ExifTool', 'File')
-    assert not (_BOOLCL and not _INSTANCE.extensions), _ERRMSG
+        _BOOLER = _INSTANCE.editable or _INSTANCE.readable
+        _BOOLCL = _BOOLER and _name not in ('ExifTool', 'File')
+        if _BOOLCL and not _INSTANCE.extensions:
+            _ERRORS.append(f"Keywords.{_name} can not be <editable or "
+                           "readable> without indicating its compatible "
+                           "<extensions=()>")
+    assert not _ERRORS, _ERRLIN0 + "\nERROR: ".join(_ERRORS) + _ERRLON1
@@ -4,17 +4,51 @@ Python wrapper for 'ExifTool' by 'Phil Harvey' https://exiftool.org/ inspired
 in 'PyExifTool' library by 'Smarnach' https://github.com/smarnach
 ------------------------------------------------------------------------------
 """
-from typing import List, Dict, Optional
+from typing import (ClassVar, Iterable, Iterator, List, Dict, Optional,
+                    Tuple, Type, TypeVar, Union)
+from collections import OrderedDict
 from pathlib import Path
+import contextlib
 import subprocess
+import threading
 import datetime
+import tempfile
+import hashlib
 import logging
-import json
 import os
+import re
 
-from kjmarotools.basics import filetools
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
-from .pygroups import Keywords
+from .pygroups import BaseKwd, Keywords
+
+
+# Field always present in the JSON of the files read by exiftool
+_TOOL_VERSION = Keywords.ExifTool.tool_version.encode()
+
+_Kernel = TypeVar("_Kernel", bound="PyKernel")
+
+# (file signature (mtime, size, ctime), metadata) kept in memory
+_CachedMetadata = Tuple[Tuple[int, int, int], Dict[str, str]]
+
+
+# "YYYY:MM:DD HH:MM:SS[+-HH:MM]" date template of the file/exif date-fields
+_DATE_RE = re.compile(r"(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})"
+                      r"(?:([+-])(\d{2}):(\d{2}))?")
+
+
+def __getattr__(name: str):
+    """
+    DEFAULT_CACHE_PATH: Suggested folder for the <cache_path> argument of the
+    kernels (resolved on first access, Path.home() may fail without HOME)
+    """
+    if name == "DEFAULT_CACHE_PATH":
+        return Path.home().joinpath(".cache", "kexiftoolmanager")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class KernelPrivateTools:
@@ -25,41 +59,62 @@ class KernelPrivateTools:
     """
     # pylint: disable=too-few-public-methods
     @staticmethod
-    def _execute(arguments: list, timeout=30):
-        """execute the commands in the terminal"""
+    def _execute_once(arguments: list, timeout=30) -> bytes:
+        """execute the commands in the terminal (in a new process)"""
         process = subprocess.run(args=arguments,
                                  stdout=subprocess.PIPE,
                                  stdin=subprocess.PIPE,
-                                 encoding='utf8',
                                  check=False,
                                  timeout=timeout)
         return process.stdout
 
     @staticmethod
-    def _logger(name: str, base_path=Path.cwd(), log_level="DEBUG"
-                ) -> logging.Logger:
-        """Initialize the logger"""
-        log_file = base_path.joinpath(name + '.log')
-        with open(log_file, "a", encoding="utf-8") as fle:
-            fle.write("-" * 41 + "\n")
-            fle.write("NEW EXECUTION: " + str(datetime.datetime.now()) + "\n")
-            fle.write("-" * 41 + "\n")
+    def _json_loads(raw_json: Union[str, bytes]):
+        """parse the exiftool JSON output (with 'orjson' if installed)"""
+        if _HAS_ORJSON:
+            try:
+                return orjson.loads(raw_json)
+            except orjson.JSONDecodeError:  # input only accepted by json
+                pass
+        import json  # pylint: disable=import-outside-toplevel
+        return json.loads(raw_json)
+
+    @staticmethod
+    def _json_dumps(data) -> bytes:
+        """serialize to JSON in UTF-8 bytes (with 'orjson' if installed)"""
+        if _HAS_ORJSON:
+            try:
+                return orjson.dumps(data)
+            except TypeError:  # eg: integers over 64 bits
+                pass
+        import json  # pylint: disable=import-outside-toplevel
+        return json.dumps(data).encode("utf-8")
 
+    @staticmethod
+    def _logger(name: str, base_path: Optional[Path] = None,
+                log_level="DEBUG") -> logging.Logger:
+        """Initialize the logger (in the current working dir by default)"""
+        log_file = (base_path or Path.cwd()).joinpath(name + '.log')
         logger = logging.getLogger(name)
         logger.setLevel(log_level)
 
-        fle_hlrs = [isinstance(x, logging.FileHandler
-                               ) for x in logger.handlers]
-        has_file_handlers = True in fle_hlrs
-
-        cmd_hlrs = [isinstance(x, logging.StreamHandler
-                               ) for x in logger.handlers]
-        has_cmd_handlers = True in cmd_hlrs
+        # FileHandler is a StreamHandler subclass, hence it's checked first
+        has_file_handlers = has_cmd_handlers = False
+        for handler in logger.handlers:
+            if isinstance(handler, logging.FileHandler):
+                has_file_handlers = True
+            elif isinstance(handler, logging.StreamHandler):
+                has_cmd_handlers = True
 
         fmt_text = "%(asctime)s | %(levelname)-5.5s | %(message)s"
         log_formatter = logging.Formatter(fmt_text)
 
         if not has_file_handlers:
+            banner = "-" * 41 + "\n"
+            banner += "NEW EXECUTION: " + str(datetime.datetime.now()) + "\n"
+            banner += "-" * 41 + "\n"
+            with open(log_file, "a", encoding="utf-8") as fle:
+                fle.write(banner)
             file_handler = logging.FileHandler(log_file)
             file_handler.setFormatter(log_formatter)
             file_handler.setLevel(log_level)
@@ -76,18 +131,28 @@ class KernelPrivateTools:
     @staticmethod
     def _filedates(values) -> datetime.datetime:
         """function to convert file date-fields to datetime"""
-        ymd = [int(x) for x in values[0].split(":")]
-        hms = [int(x) for x in values[1].split("+")[0].split(":")]
-        znes = values[1].split("+")[1].split(":")
+        match = _DATE_RE.match(f"{values[0]} {values[1]}")
+        if match is None or match[7] is None:
+            raise ValueError(f"Unexpected file date format -> {values}")
+        year, month, day, hour, minute, second = (
+            int(match[1]), int(match[2]), int(match[3]),
+            int(match[4]), int(match[5]), int(match[6]))
+        zone = datetime.timedelta(hours=int(match[8]), minutes=int(match[9]))
         return datetime.datetime(
-            ymd[0], ymd[1], ymd[2], hms[0], hms[1], hms[2],
-            tzinfo=datetime.timezone(datetime.timedelta(
-                hours=int(znes[0]), minutes=int(znes[1]))))
+            year, month, day, hour, minute, second,
+            tzinfo=datetime.timezone(zone if match[7] == "+" else -zone))
 
     @staticmethod
     def _metadates(values) -> datetime.datetime:
         """function to convert exif date-fields to datetime"""
         try:
+            # Fast path for the fixed exif template "YYYY:MM:DD HH:MM:SS"
+            ymd_str, hms_str = values[0], values[1]
+            if len(ymd_str) == 10 and len(hms_str) == 8 and ymd_str[4] == \
+                    ymd_str[7] == hms_str[2] == hms_str[5] == ":":
+                return datetime.datetime(
+                    int(ymd_str[:4]), int(ymd_str[5:7]), int(ymd_str[8:]),
+                    int(hms_str[:2]), int(hms_str[3:5]), int(hms_str[6:]))
             ymd = [int(x) for x in values[0].split(":")]
             hms = [int(x) for x in values[1].split(":")]
             return datetime.datetime(ymd[0], ymd[1], ymd[2],
@@ -98,9 +163,7 @@ class KernelPrivateTools:
     @staticmethod
     def _setmetadates(kwrd: str, date2add: datetime.datetime) -> str:
         """function used to edit exif datetime fields"""
-        bytes_kwd = ('-' + kwrd + '=')
-        bytes_date = date2add.strftime("%Y:%m:%d %H:%M:%S")
-        return bytes_kwd + bytes_date
+        return f"-{kwrd}={date2add:%Y:%m:%d %H:%M:%S}"
 
 
 class PyKernel(KernelPrivateTools):
@@ -115,12 +178,22 @@ class PyKernel(KernelPrivateTools):
                   effect in the file given.
     --------------------------------------------------------------------------
     Development:
-    - Constant <__KEYWORD> must be added to every new Child of this class
-      containing the Child.Keyword assigned (see 'kpyexif.py' as example)
+    - Constant <KEYWORD> must be added to every new Child of this class
+      containing the Child.Keyword assigned (see 'kpyexif.py' as example).
+      Inside the Child use its private alias <__KEYWORD> since <KEYWORD> is
+      shadowed by the other Childs in ExifToolManager (multiple inheritance)
 
     - See 'kpyexif.py' as example of capabilities expansion and how to get/set
       information (always based on exiftool capabilities).
 
+    - set_***() methods must only append their commands to self._commands
+      (never call self._execute()), so all of them are written with a single
+      exiftool execution in save_file() (see edit()).
+
+    - Date fields must be read with self._get_metadate(<field>) and checked
+      with self._has_metadate(<field>): each field is parsed only once per
+      file loaded, no matter how many has_***/get_*** calls are done.
+
     - When including a new kernel it must be added to PyExifMgr(...) under
       'pyexifmgr.py' script. (see PyExifManager.__doc__ for further dev-info)
     --------------------------------------------------------------------------
@@ -135,6 +208,9 @@ class PyKernel(KernelPrivateTools):
         - Py***Kernel(PyKernel) [to be placed in kpy***.py]
         - ...
 
+    - Pool: PyKernelPool() [allocated in pykernel_pool.py], N PyKernel
+            workers loading files concurrently.
+
     - Keywords: Placed in pygroups.py, it contains the Keywords used by the
                 child Kernels to access the metadata fields.
 
@@ -155,22 +231,72 @@ class PyKernel(KernelPrivateTools):
     Attributes:
         self._exiftool_path: Path (command to execute in CMD for exiftool)
         self._filepath: Path of the file loaded
+        self._filepath_str: Path of the file loaded as string
+        self._parent: Folder of the file loaded
+        self._ext: Extension of the file loaded (Uppercase without '.')
         self._metadata: Dictionary with the metadada loadad
+        self._parsed_cache: Date fields already parsed (or its parsing error)
+        self._metadata_cache: {absolute path: ((mtime, size, ctime),
+                              metadata)} read with load_files() and reused
+                              by load_file() (LRU of <memory_cache_max_files>)
+        self._cache_path: Folder of the disk cache (None if disabled)
+        self._disk_cache_files: Files in the disk cache (None if not counted)
         self._commands: List of commands to be executed
+        self._stay_open_proc: exiftool process in '-stay_open' mode used by
+                              self._execute() (self._execute_once() is only
+                              used by exiftool_version)
         self.log = logger (if logger_enabled=True)
     --------------------------------------------------------------------------
+    Stay Open:
+    - A single exiftool process is launched in '-stay_open True -@ -' mode
+      the first time it is needed and reused for every load/save, avoiding
+      the Perl interpreter start-up for each file. Call close() (or delete
+      the instance) to terminate it.
+    --------------------------------------------------------------------------
+    Disk Cache:
+    - If <cache_path> is given (eg: DEFAULT_CACHE_PATH) the metadata read is
+      saved in '<cache_path>/<hash>.json' where the hash is generated with the
+      file (path, mtime, size, ctime). Next load_file() calls of unchanged
+      files read the JSON without executing exiftool. When a new file
+      written exceeds <disk_cache_max_files> the oldest used files are
+      removed (down to 90% of it) or call evict_disk_cache().
+    --------------------------------------------------------------------------
     ExifTool useful Links:
     - https://exiftool.org/filename.html
     - https://www.exiftool.org/exiftool_pod.html
     --------------------------------------------------------------------------
     """
+    # Keyword of each Child (see Development in the docstring)
+    KEYWORD: ClassVar[Type[BaseKwd]]
+
+    # Maximum number of files kept in the disk cache (oldest used removed)
+    disk_cache_max_files = 10000
+
+    # Maximum number of files kept by load_files() for load_file() (LRU)
+    memory_cache_max_files = 1000
+
+    # Files read per exiftool execution in the batch methods (the timeout
+    # given is applied to each execution)
+    batch_max_files = 250
+
     def __init__(self, exiftool_path=Path("exiftool"), logger=True,
-                 log_path=Path.cwd()) -> None:
+                 log_path: Optional[Path] = None,
+                 cache_path: Optional[Path] = None) -> None:
         self._exiftool_path: Path = exiftool_path
+        self._cache_path: Optional[Path] = cache_path
+        self._disk_cache_files: Optional[int] = None
         self._filepath: Optional[Path] = None
+        self._filepath_str: str = ""
+        self._parent: Optional[Path] = None
+        self._ext: str = ""
         self._metadata: Dict[str, str] = {}
+        self._parsed_cache: Dict[str, Union[datetime.datetime,
+                                            Exception]] = {}
+        self._metadata_cache: "OrderedDict[Path, _CachedMetadata]"
+        self._metadata_cache = OrderedDict()
         self._commands: List[str] = []
         self._log_enabled = logger
+        self._stay_open_proc: Optional[subprocess.Popen] = None
 
         if logger:
             self.log = self._logger('Exiftoolmgr', log_path)
@@ -180,7 +306,7 @@ class PyKernel(KernelPrivateTools):
     @property
     def exiftool_version(self) -> str:
         """get the exiftool version for the given exiftool_path"""
-        return self._execute([self._exiftool_path, "-ver"])
+        return self._execute_once([self._exiftool_path, "-ver"]).decode()
 
     @property
     def exiftool_detected(self) -> bool:
@@ -201,12 +327,9 @@ class PyKernel(KernelPrivateTools):
         """return the metadata in string format"""
         if not self._metadata:
             return ""
-        spacer = max([len(x) for x in list(self._metadata.keys())])
-        out_str = ""
-        for kwd in list(self._metadata.keys()):
-            new_line = ("{:<" + str(spacer) + "} | ").format(kwd)
-            out_str += new_line + str(self._metadata[kwd]) + "\n"
-        return out_str
+        spacer = max(map(len, self._metadata))
+        return "".join([f"{kwd:<{spacer}} | {val}\n"
+                        for kwd, val in self._metadata.items()])
 
     @staticmethod
     def help_dev() -> Optional[str]:
@@ -217,29 +340,350 @@ class PyKernel(KernelPrivateTools):
         """docstring"""
         return self.__doc__
 
-    def load_file(self, file2load: Path, timeout=30) -> None:
-        """Load the file's metadata"""
+    def load_file(self, file2load: Path, timeout=30, fast_level=0,
+                  tags: Optional[Iterable[str]] = None) -> None:
+        """
+        ----------------------------------------------------------------------
+        Load the file's metadata
+        ----------------------------------------------------------------------
+        fast_level -> exiftool '-fast' option to read less of the file:
+            0: Full read (default)
+            1: '-fast'  -> The file is not read to its end: trailers after
+                           the JPEG EOI (eg: Samsung/Google extra data) are
+                           not read (the MakerNotes still are)
+            2: '-fast2' -> Also the MakerNotes are not read and the read
+                           stops at the QuickTime 'mdat' atom and the PNG
+                           'IDAT' chunk
+            3: '-fast3' -> Only the file system tags (no metadata at all)
+            WARNING: Many cameras write the MOV/MP4 'moov' atom after 'mdat'
+                     and PNG text chunks after 'IDAT', so with 2 the
+                     'QuickTime:CreateDate' and the PNG metadata may be
+                     missing (use 0 or 1 for them).
+        tags -> Read only these tags (eg: ['EXIF:DateTimeOriginal',
+                'GPS:all']) instead of all of them (default None = all)
+        NOTE: The partial reads (fast_level > 0 or tags) are not saved in
+              the disk cache. If the full metadata is already cached it is
+              used instead (it includes the tags requested).
+        ----------------------------------------------------------------------
+        """
         assert file2load.is_file(), f"File not found -> {file2load}"
         if self._log_enabled:
             self.log.info("[ExiftoolMgr] Loading file: %s", file2load)
 
         self._filepath = file2load
+        self._filepath_str = str(file2load)
+        self._parent = file2load.parent
+        self._ext = file2load.suffix[1:].upper()
         self._commands = []
         self._metadata = {}
-        raw_mdta = self._execute([self._exiftool_path, '-G', '-J', file2load],
-                                 timeout)
-
+        self._parsed_cache = {}
+
+        # Metadata already read with load_files() (if file not modified)
+        cached = self._metadata_cache.get(file2load.absolute())
+        if cached is not None and cached[0] == self._signature(file2load):
+            self._metadata_cache.move_to_end(file2load.absolute())
+            self._set_metadata(dict(cached[1]))
+            return
+
+        # Metadata saved in the disk cache (if enabled)
+        disk_cached = self._read_disk_cache(file2load)
+        if disk_cached is not None:
+            self._set_metadata(disk_cached)
+            return
+
+        arguments: List[Union[str, Path]] = ['-G', '-J', file2load]
+        if fast_level > 0:
+            arguments.insert(0, f"-fast{fast_level}")
+        if tags is not None:
+            # ExifToolVersion is always requested to check the read below
+            arguments[-1:-1] = [f"-{tag}" for tag in tags]
+            arguments.insert(-1, f"-{Keywords.ExifTool.tool_version}")
+        raw_mdta = self._execute(arguments, timeout)
         load_success = False
-        if Keywords.ExifTool.tool_version in raw_mdta:
-            self._commands.append(str(self._exiftool_path))
-            self._commands.append("-P")
-            self._metadata = json.loads(raw_mdta)[0]
+        if _TOOL_VERSION in raw_mdta:
+            self._set_metadata(self._json_loads(raw_mdta)[0])
+            if fast_level == 0 and tags is None:  # Partial is not cached
+                self._write_disk_cache(file2load, self._metadata)
             load_success = True
 
         if self._log_enabled:
             if not load_success:
                 self.log.error("File not loaded:    %s", file2load)
-                self.log.error("File loading error: %s", raw_mdta)
+                self.log.error("File loading error: %s",
+                               raw_mdta.decode(errors="replace"))
+
+    @contextlib.contextmanager
+    def edit(self: _Kernel, file2edit: Path, output_filename="",
+             overwrite=False, timeout=30, fast_level=0
+             ) -> Iterator[_Kernel]:
+        """
+        ----------------------------------------------------------------------
+        Load the file and, when leaving the 'with' block, save all the
+        set_***() commands staged inside it in a single exiftool execution
+        (see save_file() for the options). Nothing is saved on exceptions.
+            with kernel.edit(file) as edt:
+                edt.set_***(...)
+                edt.set_***(...)
+        ----------------------------------------------------------------------
+        """
+        self.load_file(file2edit, timeout, fast_level)
+        yield self
+        if len(self._commands) > 1:
+            self.save_file(output_filename, overwrite, timeout)
+
+    def load_files(self, files2load: List[Path], timeout=30
+                   ) -> List[Dict[str, str]]:
+        """
+        ----------------------------------------------------------------------
+        Read the metadata of several files with one exiftool execution per
+        <batch_max_files> files (the timeout is applied to each execution).
+        > Returns [metadata] (files not loaded are not included, the path of
+          each file is in its 'SourceFile' field)
+        ----------------------------------------------------------------------
+        NOTE: The file loaded with load_file() (if any) is not modified, but
+              the metadata of the last <memory_cache_max_files> files read
+              is kept so load_file() will not execute exiftool again for
+              these files (unless they are modified).
+        ----------------------------------------------------------------------
+        """
+        files2load = list(files2load)
+        metadata: List[Dict[str, str]] = []
+        for idx in range(0, len(files2load), self.batch_max_files):
+            chunk = files2load[idx:idx + self.batch_max_files]
+            raw_mdta = self._execute(['-G', '-J'] + chunk, timeout)
+            if _TOOL_VERSION not in raw_mdta:
+                if self._log_enabled:
+                    self.log.error("Files not loaded:    %s", chunk)
+                    self.log.error("Files loading error: %s",
+                                   raw_mdta.decode(errors="replace"))
+                continue
+            metadata += self._json_loads(raw_mdta)
+
+        for file_mdta in metadata:
+            file2load = Path(file_mdta["SourceFile"])
+            self._cache_metadata(file2load, dict(file_mdta))
+            self._write_disk_cache(file2load, file_mdta)
+        return metadata
+
+    def _cache_metadata(self, file2cache: Path, metadata: Dict[str, str]
+                        ) -> None:
+        """keep the metadata read in memory (for the next load_file())"""
+        key = file2cache.absolute()
+        self._metadata_cache[key] = (self._signature(file2cache), metadata)
+        self._metadata_cache.move_to_end(key)
+        while len(self._metadata_cache) > self.memory_cache_max_files:
+            self._metadata_cache.popitem(last=False)
+
+    def load_files_batch(self, files2load: List[Path], timeout=30
+                         ) -> Dict[Path, Dict[str, str]]:
+        """
+        ----------------------------------------------------------------------
+        Read the metadata of several files in a single exiftool execution.
+        > Returns {file: metadata} (files not loaded are not included)
+        ----------------------------------------------------------------------
+        NOTE: See load_files()
+        ----------------------------------------------------------------------
+        """
+        return {Path(file_mdta["SourceFile"]): file_mdta
+                for file_mdta in self.load_files(files2load, timeout)}
+
+    def _set_metadata(self, metadata: Dict[str, str]) -> None:
+        """set the metadata of the file loaded"""
+        self._commands.append("-P")
+        self._metadata = metadata
+
+    def _uncache(self, file2forget: Path) -> None:
+        """forget the metadata cached of a file (before writing it)"""
+        self._metadata_cache.pop(file2forget.absolute(), None)
+        cache_file = self._disk_cache_file(file2forget)
+        if cache_file is not None:
+            cache_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _signature(file2sign: Path) -> Tuple[int, int, int]:
+        """
+        get the (mtime, size, ctime) of the file: ctime is included because
+        exiftool '-P' keeps the mtime of the files written
+        """
+        stat = file2sign.stat()
+        return stat.st_mtime_ns, stat.st_size, stat.st_ctime_ns
+
+    def _disk_cache_file(self, file2cache: Path) -> Optional[Path]:
+        """get the disk cache file of the file (None if not available)"""
+        if self._cache_path is None or not file2cache.is_file():
+            return None
+        mtime, size, ctime = self._signature(file2cache)
+        key = f"{file2cache.resolve()}|{mtime}|{size}|{ctime}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16)
+        return self._cache_path.joinpath(digest.hexdigest() + ".json")
+
+    def _read_disk_cache(self, file2load: Path) -> Optional[Dict[str, str]]:
+        """read the metadata from the disk cache (None if not found)"""
+        cache_file = self._disk_cache_file(file2load)
+        if cache_file is None or not cache_file.is_file():
+            return None
+        try:
+            metadata = self._json_loads(cache_file.read_bytes())
+            os.utime(cache_file)  # Last used (for the cache eviction)
+            return metadata
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk_cache(self, file2save: Path, metadata: Dict[str, str]
+                          ) -> None:
+        """save the metadata in the disk cache (atomic write)"""
+        cache_file = self._disk_cache_file(file2save)
+        if cache_file is None:
+            return
+        try:
+            is_new = not cache_file.is_file()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    "wb", dir=cache_file.parent, suffix=".tmp",
+                    delete=False) as fle:
+                fle.write(self._json_dumps(metadata))
+            os.replace(fle.name, cache_file)
+        except OSError as err:
+            if self._log_enabled:
+                self.log.warning("Disk cache not saved for %s: %s",
+                                 file2save, err)
+            return
+
+        # The folder is only scanned the first time and when it is full
+        if not is_new:
+            return
+        if self._disk_cache_files is None:
+            self._disk_cache_files = len(self._disk_cache_entries())
+        else:
+            self._disk_cache_files += 1
+        if self._disk_cache_files > self.disk_cache_max_files:
+            self.evict_disk_cache(self.disk_cache_max_files * 9 // 10)
+
+    def _disk_cache_entries(self) -> List[Tuple[int, str]]:
+        """get the disk cache files [(last used, path)] (oldest first)"""
+        entries: List[Tuple[int, str]] = []
+        if self._cache_path is None or not self._cache_path.is_dir():
+            return entries
+        with os.scandir(self._cache_path) as scan:
+            for entry in scan:
+                try:
+                    if entry.name.endswith(".json"):
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    continue
+        entries.sort()
+        return entries
+
+    def evict_disk_cache(self, max_files: Optional[int] = None) -> None:
+        """
+        remove the oldest used files of the disk cache above <max_files>
+        (default <disk_cache_max_files>)
+        """
+        if max_files is None:
+            max_files = self.disk_cache_max_files
+        entries = self._disk_cache_entries()
+        for _, entry_path in entries[:max(len(entries) - max_files, 0)]:
+            Path(entry_path).unlink(missing_ok=True)
+        self._disk_cache_files = min(len(entries), max_files)
+
+    def _get_metadate(self, kwrd: str) -> datetime.datetime:
+        """get the date field in datetime format (parsed once per file)"""
+        if kwrd not in self._parsed_cache:
+            try:
+                self._parsed_cache[kwrd] = self._metadates(
+                    self._metadata[kwrd].split())
+            except (IndexError, KeyError, ValueError) as err:
+                self._parsed_cache[kwrd] = err
+        parsed = self._parsed_cache[kwrd]
+        if isinstance(parsed, Exception):
+            raise parsed.with_traceback(None)
+        return parsed
+
+    def _has_metadate(self, kwrd: str) -> bool:
+        """check if the date field exists and can be parsed"""
+        try:
+            self._get_metadate(kwrd)
+            return True
+        except (IndexError, KeyError, ValueError):
+            return False
+
+    def close(self) -> None:
+        """terminate the exiftool stay_open process (if running)"""
+        process = getattr(self, "_stay_open_proc", None)
+        self._stay_open_proc = None
+        if process is None:
+            return
+        assert process.stdin is not None and process.stdout is not None
+        try:
+            process.stdin.write(b"-stay_open\nFalse\n")
+            process.stdin.flush()
+            process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        process.stdin.close()
+        process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_stay_open_proc", None) is not None:
+            self.close()
+
+    def _stay_open(self) -> subprocess.Popen:
+        """get the exiftool stay_open process (launched on first call)"""
+        if self._stay_open_proc is None or \
+                self._stay_open_proc.poll() is not None:
+            self._stay_open_proc = subprocess.Popen(
+                args=[self._exiftool_path, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE)
+        return self._stay_open_proc
+
+    def _execute(self, arguments: list, timeout=30) -> bytes:
+        """
+        ----------------------------------------------------------------------
+        Execute the arguments in the exiftool stay_open process.
+        > Returns the raw output (bytes, so the JSON is parsed with no decode)
+        ----------------------------------------------------------------------
+        """
+        process = self._stay_open()
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(b"".join(
+            [os.fsencode(argument) + b"\n" for argument in arguments]))
+        process.stdin.write(b"-execute\n")
+        process.stdin.flush()
+
+        # Kill the process if {ready} is not received before the timeout
+        expired = threading.Event()
+
+        def on_timeout():
+            expired.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, on_timeout)
+        watchdog.start()
+        lines: List[bytes] = []
+        try:
+            line = process.stdout.readline()
+            while line and line.rstrip() != b"{ready}":
+                lines.append(line)
+                line = process.stdout.readline()
+        finally:
+            watchdog.cancel()
+
+        if not line:
+            self._stay_open_proc = None
+            process.wait()
+            if expired.is_set():
+                raise subprocess.TimeoutExpired(arguments, timeout)
+            err_msg = "exiftool stay_open process ended with code "
+            raise subprocess.SubprocessError(err_msg + str(process.returncode))
+        return b"".join(lines)
 
     def save_file(self, output_filename="", overwrite=False,
                   timeout=30) -> bool:
@@ -263,10 +707,11 @@ class PyKernel(KernelPrivateTools):
                 print("WARNING: No file loaded to be saved")
             return False
 
-        if len(self._commands) == 2:
+        if len(self._commands) == 1:
             self.log.warning("No commands to execute for %s", self._filepath)
             return False
 
+        self._uncache(self._filepath)
         if not output_filename or output_filename == self._filepath.name:
             result = self.__save_samename(overwrite, timeout)
             name2log = self._filepath.name
@@ -276,11 +721,13 @@ class PyKernel(KernelPrivateTools):
 
         if self._log_enabled:
             self.log.info("[ExiftoolMgr] Writing file: %s <in> %s",
-                          name2log, self._filepath.parent)
+                          name2log, self._parent)
         return ('unchanged' not in result) and ('errors' not in result)
 
     def __save_samename(self, overwrite: bool, timeout=30) -> str:
         """save file with the same name"""
+        # pylint: disable=import-outside-toplevel
+        from kjmarotools.basics import filetools  # Only needed to save
         assert self._filepath is not None, "File not loaded"
 
         # If overwrite=False (a new file must be generated)
@@ -289,10 +736,11 @@ class PyKernel(KernelPrivateTools):
             return self.__save_newname(False, new_file_path.name)
 
         # Ese execute the commands and delete the original
-        self._commands.append(str(self._filepath))
-        result = self._execute(self._commands, timeout)
+        assert self._parent is not None, "File not loaded"
+        self._commands.append(self._filepath_str)
+        result = self._execute(self._commands, timeout).decode()
         name2del = self._filepath.name + "_original"
-        os.remove(self._filepath.parent.joinpath(name2del))
+        (self._parent / name2del).unlink(missing_ok=True)
 
         # Log the results of the execution
         if self._log_enabled:
@@ -302,17 +750,20 @@ class PyKernel(KernelPrivateTools):
     def __save_newname(self, overwrite: bool, output_filename: str, timeout=30
                        ) -> str:
         """save file a new name"""
+        # pylint: disable=import-outside-toplevel
+        from kjmarotools.basics import filetools  # Only needed to save
         assert self._filepath is not None, "File not loaded"
-        new_file_path = self._filepath.parent.joinpath(output_filename)
+        assert self._parent is not None, "File not loaded"
+        new_file_path = self._parent / output_filename
 
         # If overwrite=True delete the file (if exist)
         if overwrite and new_file_path.is_file():
-            os.remove(new_file_path)
+            new_file_path.unlink()
 
         new_file_path = filetools.itername(new_file_path)
         self._commands.append("-filename=" + str(new_file_path))
-        self._commands.append(str(self._filepath))
-        result = self._execute(self._commands, timeout)
+        self._commands.append(self._filepath_str)
+        result = self._execute(self._commands, timeout).decode()
 
         # Log the results of the execution
         if self._log_enabled:
@@ -0,0 +1,68 @@
+"""pykernel_pool"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from pathlib import Path
+import queue
+import os
+
+from .pykernel import PyKernel
+
+
+class PyKernelPool:
+    """
+    --------------------------------------------------------------------------
+    Pool of PyKernel workers, each one with its own exiftool stay_open
+    process, to load the metadata of many files concurrently.
+    --------------------------------------------------------------------------
+    Threads are enough: the Python side only waits on the exiftool pipes
+    (the GIL is released while reading them).
+    --------------------------------------------------------------------------
+    Arguments:
+    - exiftool_path -> See PyKernel
+    - workers -> Number of exiftool processes (default min(8, cpu_count)).
+                 Reduce it for HDDs where concurrent reads may be slower.
+    --------------------------------------------------------------------------
+    Usage:
+        with PyKernelPool() as pool:
+            metadata = pool.map_load(files)
+    --------------------------------------------------------------------------
+    """
+    def __init__(self, exiftool_path=Path("exiftool"),
+                 workers: Optional[int] = None) -> None:
+        self._workers: int = workers or min(8, os.cpu_count() or 1)
+        self._idle: "queue.Queue[PyKernel]" = queue.Queue()
+        for _ in range(self._workers):
+            self._idle.put(PyKernel(exiftool_path, logger=False))
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+
+    def map_load(self, files2load: List[Path], timeout=30
+                 ) -> List[Dict[str, str]]:
+        """
+        ----------------------------------------------------------------------
+        Load the metadata of the files given using all the workers.
+        > Returns [metadata] in the same order ({} for files not loaded)
+        ----------------------------------------------------------------------
+        """
+        return list(self._executor.map(
+            lambda file2load: self.__load(file2load, timeout), files2load))
+
+    def close(self) -> None:
+        """terminate the threads and the exiftool processes of the pool"""
+        self._executor.shutdown()
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __load(self, file2load: Path, timeout=30) -> Dict[str, str]:
+        """load a file with an idle worker (checked out while loading)"""
+        worker = self._idle.get()
+        try:
+            worker.load_file(file2load, timeout)
+            return worker.metadata
+        finally:
+            self._idle.put(worker)
@@ -18,28 +18,8 @@ See LICENSE.md for more details.
 ------------------------------------------------------------------------------
 """
 
-# pylint: disable=line-too-long
-from distutils.core import setup
-import kexiftoolmanager
+from setuptools import setup, find_packages
 
 
-with open("README.md", "r", encoding='utf-8') as fhd:
-    long_description = fhd.read()
-
-setup(name="KexiftoolManager",
-      version=kexiftoolmanager.__version__,
-      license="GPLv3+",
-      author=kexiftoolmanager.__author__,
-      url="https://github.com/fjmaro/KexiftoolManager",
-      description="Python tool for media exif and metadata treatment with ExifTool App",
-      long_description=long_description,
-      classifiers=[
-          "Development Status :: 3 - Alpha",
-          "Intended Audience :: Developers",
-          "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",
-          "Programming Language :: Python :: 3",
-          "Topic :: Multimedia"],
-      packages=["kexiftoolmanager", "kexiftoolmanager/kernels", ],
-      python_requires='>=3.9',
-      install_requires=['kjmarotools @ git+https://github.com/fjmaro/KjmaroTools@main', ]
-      )
+# Metadata in 'pyproject.toml' (setup.py kept for legacy/editable installs)
+setup(packages=find_packages(exclude=["tests*"]))